@@ -5,34 +5,35 @@ __author__ = 'Tian Gan'
 
 from nc_utils import *
 import json
-import netCDF4
 
 
-def get_nc_meta_json(nc_file_name):
+def get_nc_meta_json(nc_file_name, header_only=False):
     """
-    (string)-> json string
+    (string, bool)-> json string
 
     Return: the netCDF Dublincore and Type specific Metadata
     """
 
-    nc_meta_dict = get_nc_meta_dict(nc_file_name)
+    nc_meta_dict = get_nc_meta_dict(nc_file_name, header_only)
     nc_meta_json = json.dumps(nc_meta_dict)
     return nc_meta_json
 
 
-def get_nc_meta_dict(nc_file_name):
+def get_nc_meta_dict(nc_file_name, header_only=False):
     """
-    (string)-> dict
+    (string or object, bool)-> dict
 
     Return: the netCDF Dublincore and Type specific Metadata
+    nc_file_name is either a file path or an opened netCDF dataset, which is recognized by its variables attribute.
+    If header_only is True, no variable data is read and the coverage comes from the ACDD global attributes
     """
 
-    if isinstance(nc_file_name, netCDF4.Dataset):
+    if hasattr(nc_file_name, 'variables'):
         nc_dataset = nc_file_name
     else:
         nc_dataset = get_nc_dataset(nc_file_name)
 
-    dublin_core_meta = get_dublin_core_meta(nc_dataset)
+    dublin_core_meta = get_dublin_core_meta(nc_dataset, header_only)
     type_specific_meta = get_type_specific_meta(nc_dataset)
     nc_meta_dict = {'dublin_core_meta': dublin_core_meta, 'type_specific_meta': type_specific_meta}
     nc_dataset.close()
@@ -40,15 +41,18 @@ def get_nc_meta_dict(nc_file_name):
     return nc_meta_dict
 
 
-def get_dublin_core_meta(nc_dataset):
+def get_dublin_core_meta(nc_dataset, header_only=False):
     """
-    (object)-> dict
+    (object, bool)-> dict
 
     Return: the netCDF dublin core metadata
     """
 
     nc_global_meta = extract_nc_global_meta(nc_dataset)
-    nc_coverage_meta = extract_nc_coverage_meta(nc_dataset)
+    if header_only:
+        nc_coverage_meta = extract_nc_coverage_header_meta(nc_dataset)
+    else:
+        nc_coverage_meta = extract_nc_coverage_meta(nc_dataset)
     dublin_core_meta = dict(nc_global_meta.items() + nc_coverage_meta.items())
 
     return dublin_core_meta
@@ -115,6 +119,37 @@ def extract_nc_coverage_meta(nc_dataset):
     return nc_coverage_meta
 
 
+def extract_nc_coverage_header_meta(nc_dataset):
+    """
+    (object)->dict
+
+    Return netCDF temporal and spatial coverage from ACDD global attributes without reading any variable data.
+    Coverage without the corresponding attributes is left out as unavailable
+    """
+
+    nc_coverage_meta = {}
+
+    coverage_vs_convention = {
+        'temporal': ('T', 'time_coverage_start', 'time_coverage_end', 'ISO8601'),  # ACDD times are ISO 8601 strings
+        'spatial_x': ('X', 'geospatial_lon_min', 'geospatial_lon_max', 'geospatial_lon_units'),
+        'spatial_y': ('Y', 'geospatial_lat_min', 'geospatial_lat_max', 'geospatial_lat_units'),
+    }  # key is the coverage type, value is coordinate type and corresponding attributes from ACDD convention
+
+    for coverage, (coor_type, start, end, units) in coverage_vs_convention.items():
+        if hasattr(nc_dataset, start) and hasattr(nc_dataset, end):
+            if coor_type == 'T':
+                coor_units = units
+            else:
+                coor_units = nc_dataset.__dict__[units] if hasattr(nc_dataset, units) else ''
+            nc_coverage_meta[coverage] = {
+                coor_type + '_start': get_nc_attribute_value(nc_dataset.__dict__[start]),
+                coor_type + '_end': get_nc_attribute_value(nc_dataset.__dict__[end]),
+                coor_type + '_units': get_nc_attribute_value(coor_units)
+            }
+
+    return nc_coverage_meta
+
+
 def get_type_specific_meta(nc_dataset):
     """
     (object)-> dict
@@ -72,6 +72,8 @@ def get_nc_global_attributes(nc_subset_info):
 
 
 def create_nc_rootgroup(nc_global_attributes):
+    import netCDF4  # deferred so importing this module stays cheap
+
     # initiate a rootgroup
     file_name = 'subset_' + nc_global_attributes.pop('file_name')
     file_format = nc_global_attributes.pop('file_format')
@@ -7,7 +7,6 @@ Module provides utility functions to manipulate netCDF dataset.
 __author__ = 'Tian Gan'
 
 
-import netCDF4
 import re
 from collections import OrderedDict
 
@@ -20,6 +19,8 @@ def get_nc_dataset(nc_file_name):
     Return: the netCDF dataset
     """
 
+    import netCDF4  # deferred so importing this module stays cheap
+
     nc_dataset = netCDF4.Dataset(nc_file_name, 'r')
     return nc_dataset
 
@@ -43,6 +44,19 @@ def get_nc_variable_original_meta(nc_dataset, nc_variable_name):
     return nc_variable_original_meta
 
 
+def get_nc_attribute_value(nc_attribute):
+    """
+    (object)-> object
+
+    Return: the attribute value as a native python value, as netCDF4 returns numeric attributes as numpy types
+    """
+
+    if hasattr(nc_attribute, 'tolist'):
+        return nc_attribute.tolist()
+
+    return nc_attribute
+
+
 def get_nc_variable_dimensions_detail(nc_file_name, nc_variable_name):
     """
     (string, string)-> dict
@@ -180,6 +194,7 @@ def get_nc_coordinate_variable_info(nc_dataset, nc_coordinate_variable_name):
     coordinate_type = get_coordinate_variable_type(nc_coordinate_variable)
 
     if coordinate_type == 'T' and hasattr(nc_coordinate_variable, 'units'):
+        import netCDF4  # deferred so importing this module stays cheap
         nc_time_calendar = nc_coordinate_variable.calendar if hasattr(nc_coordinate_variable, 'calendar') else 'standard'
         for i in range(len(coordinate_data)):
             coordinate_data[i] = str(netCDF4.num2date(coordinate_data[i],
@@ -0,0 +1,102 @@
+"""
+Tests for the netCDF metadata extraction in nc_meta.
+"""
+__author__ = 'Tian Gan'
+
+import json
+import subprocess
+import sys
+
+import pytest
+
+from nc_meta import get_nc_meta_dict, get_nc_meta_json
+
+
+class StubVariable(object):
+    """
+    netCDF variable stand-in which fails on any data read
+    """
+
+    def __init__(self, dimensions, shape, **attributes):
+        self.__dict__.update(attributes)
+        self.dimensions = dimensions
+        self.shape = shape
+        self.dtype = 'float32'
+
+    def __getitem__(self, key):
+        raise AssertionError('variable data was read')
+
+
+class StubDataset(object):
+    """
+    netCDF dataset stand-in with coordinate variables and ACDD global attributes
+    """
+
+    def __init__(self, variables, **attributes):
+        self.__dict__.update(attributes)
+        self.dimensions = {'time': None, 'lat': None, 'lon': None}
+        self.variables = variables
+
+    def close(self):
+        pass
+
+
+def test_get_nc_meta_dict_header_only_reads_no_variable_data():
+    nc_dataset = StubDataset(
+        {
+            'time': StubVariable(('time',), (3,), axis='T', units='days since 2000-01-01'),
+            'lat': StubVariable(('lat',), (2,), axis='Y', units='degrees_north'),
+            'lon': StubVariable(('lon',), (2,), axis='X', units='degrees_east'),
+            'pr': StubVariable(('time', 'lat', 'lon'), (3, 2, 2), units='mm', long_name='precipitation'),
+        },
+        title='ACDD sample',
+        time_coverage_start='2000-01-01T00:00:00Z',
+        time_coverage_end='2000-01-03T00:00:00Z',
+        geospatial_lat_min=-10.5,
+        geospatial_lat_max=10.5,
+        geospatial_lat_units='degrees_north',
+    )
+
+    nc_meta_dict = get_nc_meta_dict(nc_dataset, header_only=True)
+    dublin_core_meta = nc_meta_dict['dublin_core_meta']
+
+    assert dublin_core_meta['title'] == 'ACDD sample'
+    assert dublin_core_meta['temporal'] == {'T_start': '2000-01-01T00:00:00Z',
+                                            'T_end': '2000-01-03T00:00:00Z',
+                                            'T_units': 'ISO8601'}
+    assert dublin_core_meta['spatial_y'] == {'Y_start': -10.5, 'Y_end': 10.5, 'Y_units': 'degrees_north'}
+    assert 'spatial_x' not in dublin_core_meta
+    assert list(nc_meta_dict['type_specific_meta'].keys()) == ['pr']
+
+
+def test_module_import_does_not_import_netcdf4():
+    code = ('import sys, nc_meta, nc_subset, nc_utils\n'
+            'sys.exit(int("netCDF4" in sys.modules))')
+
+    assert subprocess.call([sys.executable, '-c', code]) == 0
+
+
+def test_get_nc_meta_json_header_only_float32_geospatial(tmpdir):
+    netCDF4 = pytest.importorskip('netCDF4')
+    numpy = pytest.importorskip('numpy')
+
+    nc_file_name = str(tmpdir.join('acdd.nc'))
+    nc_dataset = netCDF4.Dataset(nc_file_name, 'w')
+    nc_dataset.title = 'ACDD sample'
+    nc_dataset.time_coverage_start = '2000-01-01T00:00:00Z'
+    nc_dataset.time_coverage_end = '2000-12-31T00:00:00Z'
+    nc_dataset.geospatial_lat_min = numpy.float32(-10.5)
+    nc_dataset.geospatial_lat_max = numpy.float32(10.5)
+    nc_dataset.geospatial_lat_units = 'degrees_north'
+    nc_dataset.geospatial_lon_min = numpy.int32(-20)
+    nc_dataset.geospatial_lon_max = numpy.int32(20)
+    nc_dataset.close()
+
+    nc_meta_dict = json.loads(get_nc_meta_json(nc_file_name, header_only=True))
+    dublin_core_meta = nc_meta_dict['dublin_core_meta']
+
+    assert dublin_core_meta['spatial_y'] == {'Y_start': -10.5, 'Y_end': 10.5, 'Y_units': 'degrees_north'}
+    assert dublin_core_meta['spatial_x'] == {'X_start': -20, 'X_end': 20, 'X_units': ''}
+    assert dublin_core_meta['temporal'] == {'T_start': '2000-01-01T00:00:00Z',
+                                            'T_end': '2000-12-31T00:00:00Z',
+                                            'T_units': 'ISO8601'}